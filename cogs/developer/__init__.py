@@ -7,6 +7,11 @@ import discord
 from discord.ext.pages import Paginator
 from discord.utils import as_chunks
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 from core import Cog, GuildModel
 
 from .rtfm import OVERRIDES, TARGETS, SphinxObjectFileReader, create_buttons, finder
@@ -24,9 +29,13 @@ GITHUB_GIST_RE = re.compile(
     r"(-L(?P<start_line>\d+)([-~:]L(?P<end_line>\d+))?)"
 )
 
-PULL_HASH_REGEX = re.compile(
-    r"(?:(?P<org>(?:[A-Za-z]|\d|-)+)\/)?(?P<repo>(?:[A-Za-z]|\d|-|_|\.)+)?(?:#)(?P<index>[0-9]+)"
-)
+PULL_HASH_PATTERN = r"(?:(?P<org>[A-Za-z0-9-]+)/)?(?P<repo>[\w.-]+)?#(?P<index>\d+)"
+
+if re2 is None:
+    PULL_HASH_REGEX = re.compile(PULL_HASH_PATTERN, re.ASCII)
+else:
+    # RE2's \w is ASCII-only already
+    PULL_HASH_REGEX = re2.compile(PULL_HASH_PATTERN)
 
 
 async def rtfm_autocomplete(ctx: discord.AutocompleteContext):
@@ -255,10 +264,21 @@ class Developer(Cog):
         self, ctx: discord.ApplicationContext, message: discord.Message
     ):
         """Extract GitHub issue and pull request links mentioned with #."""
+        mentions = {}
+        if "#" in message.content:
+            for match in PULL_HASH_REGEX.finditer(message.content):
+                mentions[match.groups("")] = None
+                if len(mentions) == 10:
+                    break
+        if not mentions:
+            return await ctx.respond(
+                "No GitHub issue or pull request mentions (ex. #123) found."
+            )
+
         links = []
         data = await GuildModel.get_or_none(id=ctx.guild_id)
-        for org, repo, index in {*PULL_HASH_REGEX.findall(message.content)[:10]}:
-            data_split = data and data.repo.split("/") or []
+        data_split = data and data.repo and data.repo.split("/") or []
+        for org, repo, index in mentions:
             if not repo and len(data_split) >= 1:
                 repo = data_split[-1]
                 if not org and len(data_split) == 2:
@@ -270,10 +290,6 @@ class Developer(Cog):
                 )
             links.append(f"https://github.com/{org}/{repo}/pull/{index}")
 
-        if not links:
-            return await ctx.respond(
-                "No GitHub issue or pull request mentions (ex. #123) found."
-            )
         await ctx.respond(
             links[0] if len(links) == 1 else "\n".join(f"<{link}>" for link in links)
         )
@@ -334,7 +350,7 @@ class Developer(Cog):
     @discord.option(
         "documentation",
         description="The documentation to search through.",
-        choices=[*TARGETS.keys()],
+        choices=[*TARGETS],
     )
     @discord.option(
         "query", description="The search query.", autocomplete=rtfm_autocomplete
@@ -40,10 +40,12 @@ class CreateThreadModal(discord.ui.Modal):
     async def callback(self, interaction: discord.Interaction) -> None:
         assert self.view.message and self.children[0].value
         thread = await self.view.message.create_thread(name=self.children[0].value)
-        await interaction.response.send_message(
-            f"Thread created: {thread.mention}", ephemeral=True
+        await asyncio.gather(
+            interaction.response.send_message(
+                f"Thread created: {thread.mention}", ephemeral=True
+            ),
+            self.view.message.edit(view=None),
         )
-        await self.view.message.edit(view=None)
         self.view.stop()
 
 
@@ -2,28 +2,105 @@ from urllib import parse
 
 from asyncio import sleep
 from random import choice
+from time import monotonic
 
 import discord
 from discord.utils import TimestampStyle, format_dt, utcnow
 
 from core import Cog, Context
 
+GOOGLE_SEARCH = "https://www.google.com/search?"
+BING_SEARCH = "https://www.bing.com/search?"
+DUCKDUCKGO_SEARCH = "https://www.duckduckgo.com/?"
+BOOST_EMOJIS = ("<:boost:1007970712977420338>", "<:shiny_boost:1007971330332839996>")
+
 
 class Miscellaneous(Cog):
     """Miscellaneous commands."""
 
-    @discord.slash_command()
-    @discord.guild_only()
-    async def serverinfo(self, ctx: Context):
-        """View information/statistics about the server."""
-        guild = ctx.guild
-        assert guild
+    def __init__(self, bot) -> None:
+        super().__init__(bot)
+        self.bot.cache["bot_counts"] = {}
+        self.bot.cache["role_summary"] = {}
+        self.bot.cache["serverinfo_embed"] = {}
+
+    def clear_cache(self, guild_id: int, *keys: str) -> None:
+        """Drop the cached entries of a guild, including its serverinfo embed."""
+        for key in (*keys, "serverinfo_embed"):
+            self.bot.cache[key].pop(guild_id, None)
+
+    def bot_count(self, guild: discord.Guild) -> int:
+        """Return the amount of bots in a guild, cached for 5 minutes."""
+        cache = self.bot.cache["bot_counts"]
+        entry = cache.get(guild.id)
+        if entry is None or monotonic() - entry[1] > 300:
+            entry = cache[guild.id] = (
+                sum(1 for m in guild.members if m.bot),
+                monotonic(),
+            )
+        return entry[0]
+
+    def role_summary(self, guild: discord.Guild) -> tuple[int, str]:
+        """Return the role count and the highest role mention of a guild."""
+        cache = self.bot.cache["role_summary"]
+        if (summary := cache.get(guild.id)) is None:
+            summary = cache[guild.id] = (len(guild._roles), guild.roles[-1].mention)
+        return summary
+
+    @Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self.clear_cache(member.guild.id, "bot_counts")
+
+    @Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self.clear_cache(member.guild.id, "bot_counts")
+
+    @Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        self.clear_cache(channel.guild.id)
+
+    @Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self.clear_cache(channel.guild.id)
+
+    @Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role):
+        self.clear_cache(role.guild.id, "role_summary")
+
+    @Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self.clear_cache(role.guild.id, "role_summary")
+
+    @Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        self.clear_cache(after.guild.id, "role_summary")
+
+    @Cog.listener()
+    async def on_guild_update(self, before: discord.Guild, after: discord.Guild):
+        self.clear_cache(after.id)
+
+    @Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.clear_cache(guild.id, "bot_counts", "role_summary")
+
+    def serverinfo_embed(self, guild: discord.Guild) -> discord.Embed:
+        """Build the serverinfo embed of a guild, reusing it for 60 seconds."""
+        cache = self.bot.cache["serverinfo_embed"]
+        entry = cache.get(guild.id)
+        if entry is not None and monotonic() - entry[0] <= 60:
+            return discord.Embed.from_dict(entry[1])
+
         creation = ((guild.id >> 22) + 1420070400000) // 1000
-        boost_emoji = (
-            "<:shiny_boost:1007971330332839996>"
-            if guild.premium_subscription_count > 0
-            else "<:boost:1007970712977420338>"
-        )
+        role_count, highest_role = self.role_summary(guild)
+        text = voice = categories = 0
+        for channel in guild._channels.values():
+            if isinstance(channel, discord.TextChannel):
+                text += 1
+            elif isinstance(channel, discord.VoiceChannel):
+                voice += 1
+            elif isinstance(channel, discord.CategoryChannel):
+                categories += 1
+        boost_emoji = BOOST_EMOJIS[guild.premium_subscription_count > 0]
 
         embed = (
             discord.Embed(
@@ -34,7 +111,7 @@ class Miscellaneous(Cog):
             )
             .add_field(
                 name="Members",
-                value=f"Total: {guild.member_count}\nBots: {sum(m.bot for m in guild.members)}",
+                value=f"Total: {guild.member_count}\nBots: {self.bot_count(guild)}",
             )
             .add_field(
                 name="Time of Creation",
@@ -42,28 +119,36 @@ class Miscellaneous(Cog):
             )
             .add_field(
                 name="Channels",
-                value=f"Text: {len(guild.text_channels)}\nVoice: {len(guild.voice_channels)}"
-                f"\nCategories: {len(guild.categories)}",
+                value=f"Text: {text}\nVoice: {voice}\nCategories: {categories}",
             )
             .add_field(
                 name="Roles",
-                value=f"{len(guild._roles)} roles\nHighest:\n{guild.roles[-1].mention}",
+                value=f"{role_count} roles\nHighest:\n{highest_role}",
             )
             .add_field(
                 name="Boost Status",
                 value=f"Level {guild.premium_tier}\n"
                 f"{boost_emoji}{guild.premium_subscription_count} boosts",
             )
-            .set_footer(
-                text=f"Requested by {ctx.author}",
-                icon_url=ctx.author.display_avatar.url,
-            )
         )
         if owner := guild.owner:
             embed.insert_field_at(0, name="Owner", value=f"{owner}\n{owner.mention}")
         if icon := guild.icon:
             embed.set_thumbnail(url=icon.url)
-        await ctx.respond(embed=embed)
+        cache[guild.id] = (monotonic(), embed.to_dict())
+        return embed
+
+    @discord.slash_command()
+    @discord.guild_only()
+    async def serverinfo(self, ctx: Context):
+        """View information/statistics about the server."""
+        assert ctx.guild
+        await ctx.respond(
+            embed=self.serverinfo_embed(ctx.guild).set_footer(
+                text=f"Requested by {ctx.author}",
+                icon_url=ctx.author.display_avatar.url,
+            )
+        )
 
     def permissions(self, target: discord.Member, include: int = 0) -> str:
         permissions = target.guild_permissions
@@ -164,18 +249,16 @@ class Miscellaneous(Cog):
     @discord.option("query", description="The query to make.")
     async def search(self, ctx: Context, *, query: str):
         """Get a search url from Bing, DuckDuckGo and Google."""
-        param = parse.urlencode({"q": query})
+        if not query.strip():
+            return await ctx.respond("You have to provide a query.", ephemeral=True)
+        param = "q=" + parse.quote_plus(query)
         await ctx.respond(
             f"Use the buttons below to search for `{query}` on the internet.",
             view=discord.ui.View(
+                discord.ui.Button(label="Google", url=f"{GOOGLE_SEARCH}{param}"),
+                discord.ui.Button(label="Bing", url=f"{BING_SEARCH}{param}"),
                 discord.ui.Button(
-                    label="Google", url=f"https://www.google.com/search?{param}"
-                ),
-                discord.ui.Button(
-                    label="Bing", url=f"https://www.bing.com/search?{param}"
-                ),
-                discord.ui.Button(
-                    label="DuckDuckGo", url=f"https://www.duckduckgo.com/?{param}"
+                    label="DuckDuckGo", url=f"{DUCKDUCKGO_SEARCH}{param}"
                 ),
             ),
         )
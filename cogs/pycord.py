@@ -203,9 +203,13 @@ class Pycord(Cog):
 
     @Cog.listener()
     async def on_message(self, message: discord.Message):
-        if message.guild is not None and message.guild.id == 881207955029110855:
+        if (
+            message.guild is not None
+            and message.guild.id == 881207955029110855
+            and "pastebin.com" in message.content
+        ):
             messages = []
-            matches = re.findall(PASTEBIN_RE, message.content)
+            matches = PASTEBIN_RE.findall(message.content)
             for match in matches:
                 base_url, paste_id = match
                 messages.append(f"{base_url}/raw/{paste_id}")
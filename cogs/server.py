@@ -1,7 +1,8 @@
+import asyncio
+
 import discord
-from discord.utils import get
 from aiohttp import InvalidURL
-from io import BytesIO
+from discord.ext import commands
 
 from core import Cog, Context, GuildModel
 
@@ -9,6 +10,51 @@ from core import Cog, Context, GuildModel
 class Server(Cog):
     """Commands related to server settings."""
 
+    def __init__(self, bot) -> None:
+        super().__init__(bot)
+        self.bot.cache["suggestions_channel"] = {}
+        self.bot.cache["emoji_by_name"] = {}
+
+    def emojis_by_name(self, emojis) -> dict[str, list[discord.Emoji]]:
+        """Group emojis by their names, since names aren't unique."""
+        mapping: dict[str, list[discord.Emoji]] = {}
+        for emoji in emojis:
+            mapping.setdefault(emoji.name, []).append(emoji)
+        return mapping
+
+    async def get_suggestions_channel(
+        self, guild: discord.Guild
+    ) -> discord.TextChannel | None:
+        """Return the suggestions channel of a guild, caching it."""
+        cache = self.bot.cache["suggestions_channel"]
+        if guild.id not in cache:
+            cache[guild.id] = await GuildModel.get_text_channel(guild, "suggestions")
+        return cache[guild.id]
+
+    @Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        cache = self.bot.cache["suggestions_channel"]
+        if (cached := cache.get(channel.guild.id)) and cached.id == channel.id:
+            del cache[channel.guild.id]
+
+    @Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.bot.cache["suggestions_channel"].pop(guild.id, None)
+        self.bot.cache["emoji_by_name"].pop(guild.id, None)
+
+    @Cog.listener()
+    async def on_guild_available(self, guild: discord.Guild):
+        self.bot.cache["suggestions_channel"].pop(guild.id, None)
+        self.bot.cache["emoji_by_name"].pop(guild.id, None)
+
+    @Cog.listener()
+    async def on_guild_emojis_update(
+        self, guild: discord.Guild, before, after: list[discord.Emoji]
+    ):
+        cache = self.bot.cache["emoji_by_name"]
+        if guild.id in cache:
+            cache[guild.id] = self.emojis_by_name(after)
+
     emoji = discord.SlashCommandGroup(
         "emoji",
         "Commands related to emojis.",
@@ -19,6 +65,7 @@ class Server(Cog):
     @emoji.command(name="add")
     @discord.option("name", description="The name of the emoji.")
     @discord.option("url", description="The image url of the emoji.")
+    @commands.cooldown(1, 10, commands.BucketType.user)
     async def emoji_add(self, ctx: Context, name: str, url: str):
         """Add a custom emoji to this guild."""
         assert ctx.guild
@@ -26,8 +73,18 @@ class Server(Cog):
         try:
             async with self.bot.http_session.get(url) as res:
                 if 300 > res.status >= 200:
+                    too_large = (
+                        "The image is too large, emojis can't be larger than 256 KB."
+                    )
+                    if (res.content_length or 0) > 262144:
+                        return await ctx.respond(too_large, ephemeral=True)
+                    image = bytearray()
+                    async for chunk in res.content.iter_chunked(65536):
+                        image += chunk
+                        if len(image) > 262144:
+                            return await ctx.respond(too_large, ephemeral=True)
                     emoji = await ctx.guild.create_custom_emoji(
-                        name=name, image=BytesIO(await res.read()).getvalue()
+                        name=name, image=bytes(image)
                     )
                     await ctx.respond(f"{emoji} Successfully created emoji.")
                 else:
@@ -51,8 +108,11 @@ class Server(Cog):
         """Delete a custom emoji from this guild."""
         assert ctx.guild
         await ctx.assert_permissions(manage_emojis=True)
-        if emoji := get(ctx.guild.emojis, name=name):
-            await emoji.delete(reason=reason)
+        cache = self.bot.cache["emoji_by_name"]
+        if (emojis := cache.get(ctx.guild.id)) is None:
+            emojis = cache[ctx.guild.id] = self.emojis_by_name(ctx.guild.emojis)
+        if matches := emojis.get(name):
+            await matches[0].delete(reason=reason)
             return await ctx.respond(f"Successfully deleted emoji `:{name}:`.")
         await ctx.respond(f'No emoji named "{name}" found.')
 
@@ -73,6 +133,7 @@ class Server(Cog):
         await GuildModel.update_or_create(
             id=ctx.guild_id, defaults={"suggestions": channel.id}
         )
+        self.bot.cache["suggestions_channel"][ctx.guild_id] = channel
         await ctx.respond(f"Member suggestions will now be sent to {channel.mention}.")
 
     @suggestions.command(name="disable")
@@ -84,6 +145,7 @@ class Server(Cog):
             .first()
         ):
             await guild.update_from_dict({"suggestions": 0}).save()
+            self.bot.cache["suggestions_channel"][ctx.guild_id] = None
             return await ctx.respond(
                 "Member suggestions have been disabled for this server."
             )
@@ -92,11 +154,12 @@ class Server(Cog):
     @discord.slash_command()
     @discord.guild_only()
     @discord.option("suggestion", description="The suggestion.")
+    @commands.cooldown(3, 60, commands.BucketType.user)
     async def suggest(self, ctx: Context, *, suggestion: str):
         """Make a suggestion for the server. This will be sent to the channel set by the server managers."""
         await ctx.assert_permissions(external_emojis=True)
         assert ctx.guild
-        if not (channel := await GuildModel.get_text_channel(ctx.guild, "suggestions")):
+        if not (channel := await self.get_suggestions_channel(ctx.guild)):
             return await ctx.respond("This server doesn't have a suggestions channel.")
 
         msg = await channel.send(
@@ -107,12 +170,14 @@ class Server(Cog):
             .set_author(name=str(ctx.author), icon_url=ctx.author.display_avatar.url)
             .set_footer(text=f"ID: {ctx.author.id}")
         )
-        await msg.add_reaction("<:upvote:881521766231584848>")
-        await msg.add_reaction("<:downvote:904068725475508274>")
-        await ctx.success(
-            "Suggestion Sent",
-            f"Your suggestion has been sent to {channel.mention}.",
-            ephemeral=True,
+        await asyncio.gather(
+            msg.add_reaction("<:upvote:881521766231584848>"),
+            msg.add_reaction("<:downvote:904068725475508274>"),
+            ctx.success(
+                "Suggestion Sent",
+                f"Your suggestion has been sent to {channel.mention}.",
+                ephemeral=True,
+            ),
         )
 
 def setup(bot):
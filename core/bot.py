@@ -64,6 +64,11 @@ class Bond(commands.Bot):
         print(self.user, "is ready")
 
     async def on_application_command_error(self, ctx: Context, error: Exception):
+        if isinstance(error, commands.CommandOnCooldown):
+            return await ctx.respond(
+                f"This command is on cooldown, try again in {error.retry_after:.1f} seconds.",
+                ephemeral=True,
+            )
         if isinstance(error, discord.ApplicationCommandInvokeError):
             if isinstance((error := error.original), discord.HTTPException):
                 message = (